@@ -17,8 +17,7 @@ import os
 import tty
 import termios
 import select
-import copy
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Sequence
 from enum import Enum
 
 # Import AI module
@@ -86,10 +85,203 @@ COLORS: Dict[str, str] = {
     'L': Color.GREEN
 }
 
+# Fall speed per level: 0.8s at level 1, 0.05s faster each level, floored at 0.1s
+MAX_SPEED_LEVEL: int = 50
+LEVEL_FALL_SPEED: Tuple[float, ...] = tuple(max(0.1, 0.8 - (level - 1) * 0.05)
+                                            for level in range(1, MAX_SPEED_LEVEL + 1))
+LEVEL_FALL_NS: Tuple[int, ...] = tuple(round(speed * 1e9) for speed in LEVEL_FALL_SPEED)
+
+# Piece types in a fixed order, refilled into the 7-bag randomizer
+SHAPE_TYPES: Tuple[str, ...] = tuple(SHAPES)
+
+# Encoded cell output keyed by board value (' ' for empty, else piece color)
+EMPTY_CELL_BYTES: bytes = (Color.GRAY + '·' + Color.RESET).encode()
+CELL_BYTES: Dict[str, bytes] = {color: (color + '█' + Color.RESET).encode() for color in COLORS.values()}
+CELL_BYTES[' '] = EMPTY_CELL_BYTES
+
+# Top rows marked as the spawn zone
+SPAWN_ZONE_HEIGHT: int = 3
+SPAWN_MARK: str = Color.GRAY + "┊" + Color.RESET
+
+# Mode status lines shown under the board every frame
+AI_STATUS_LINE: str = f"{Color.GREEN}[SURVIVAL AI - NEVER LOSE MODE - TURBO]{Color.RESET} Press 'I' for manual"
+MANUAL_STATUS_LINE: str = "[MANUAL MODE] - Press 'I' to enable SURVIVAL AI"
+
+
+def _shape_row_bits(row: List[int]) -> int:
+    """Pack one shape row into a bitmask (bit c set = column c filled)"""
+    bits: int = 0
+    for c, val in enumerate(row):
+        if val:
+            bits |= 1 << c
+    return bits
+
+
+# Row bitmasks for every rotation of every tetromino
+SHAPE_BITS: Dict[str, List[List[int]]] = {
+    shape_type: [[_shape_row_bits(row) for row in rotation] for rotation in rotations]
+    for shape_type, rotations in SHAPES.items()
+}
+
+# Filled (row, col) offsets for every rotation of every tetromino
+SHAPE_CELLS: Dict[str, List[List[Tuple[int, int]]]] = {
+    shape_type: [[(r, c) for r, row in enumerate(rotation) for c, val in enumerate(row) if val]
+                 for rotation in rotations]
+    for shape_type, rotations in SHAPES.items()
+}
+
+# Lowest filled row offset in each column offset, for every rotation of every tetromino
+PIECE_BOTTOM: Dict[str, List[Dict[int, int]]] = {
+    shape_type: [{c: max(r for r, row in enumerate(rotation) if row[c])
+                  for c in range(len(rotation[0]))}
+                 for rotation in rotations]
+    for shape_type, rotations in SHAPES.items()
+}
+
+# Bounding-box width for every rotation of every tetromino
+SHAPE_WIDTH: Dict[str, List[int]] = {
+    shape_type: [len(rotation[0]) for rotation in rotations]
+    for shape_type, rotations in SHAPES.items()
+}
+
+# Wall kicks tried, in order, when a rotation does not fit in place (+y down).
+# Canonical SRS offsets assume pieces rotating about the SRS centres; SHAPES are
+# trimmed matrices that rotate about their top-left corner, so SRS does not fit
+WALL_KICKS: Tuple[Tuple[int, int], ...] = ((-1, 0), (1, 0), (0, -1), (-2, 0), (2, 0))
+
+
+# State captured by TetrisGame.snapshot(): rows, color grid, column heights,
+# score, level, lines cleared, game over flag, fall speed and timer, the 7-bag,
+# the current piece's type, rotation, x and y, and the next piece's type, x and y
+GameSnapshot = Tuple[List[int], List[List[str]], List[int], int, int, int, bool, int, int,
+                     List[str], str, int, int, int, str, int, int]
+
+
+# Bitboard core: plain-int helpers over a list of row bitmasks, shared by
+# TetrisGame and the AI's rollouts so neither needs Tetromino objects
+
+def piece_fits(rows: List[int], full_row: int, shape_type: str, rotation: int, x: int, y: int) -> bool:
+    """Check if a piece fits on the rows at (x, y); rows above the board are free"""
+    # Shapes are trimmed to their bounding box, so column 0 is always filled
+    if x < 0:
+        return False
+
+    height: int = len(rows)
+    wall_mask: int = ~full_row
+    for r, bits in enumerate(SHAPE_BITS[shape_type][rotation]):
+        shifted: int = bits << x
+
+        # Check right wall
+        if shifted & wall_mask:
+            return False
+
+        row_y: int = y + r
+        if row_y < 0:
+            continue
+
+        # Check floor and collision with placed pieces
+        if row_y >= height or rows[row_y] & shifted:
+            return False
+    return True
+
+
+def stamp_piece(rows: List[int], full_row: int, shape_type: str, rotation: int, x: int, y: int) -> None:
+    """OR a piece into the rows in place, dropping any part outside the board"""
+    height: int = len(rows)
+    for r, bits in enumerate(SHAPE_BITS[shape_type][rotation]):
+        row_y: int = y + r
+        if 0 <= row_y < height:
+            shifted: int = bits << x if x >= 0 else bits >> -x
+            rows[row_y] |= shifted & full_row
+
+
+def drop_distance(rows: Sequence[int], shape_type: str, rotation: int, x: int, y: int) -> int:
+    """Number of rows a fitting piece can fall from (x, y) before it lands"""
+    height: int = len(rows)
+    shifted: List[int] = [bits << x for bits in SHAPE_BITS[shape_type][rotation]]
+
+    # One fused loop instead of re-checking walls through piece_fits per step
+    dy: int = 1
+    while True:
+        for r, bits in enumerate(shifted):
+            row_y: int = y + r + dy
+            if row_y >= height or (row_y >= 0 and rows[row_y] & bits):
+                return dy - 1
+        dy += 1
+
+
+def column_tops(rows: Sequence[int], full_row: int) -> List[int]:
+    """Topmost filled row of each column (len(rows) for an empty column)"""
+    height: int = len(rows)
+    tops: List[int] = [height] * full_row.bit_length()
+    remaining: int = full_row  # Columns whose top is not found yet
+    for r, bits in enumerate(rows):
+        new_tops: int = bits & remaining
+        if new_tops:
+            remaining ^= new_tops
+            while new_tops:
+                low: int = new_tops & -new_tops
+                tops[low.bit_length() - 1] = r
+                new_tops ^= low
+            if not remaining:
+                break
+    return tops
+
+
+def landing_distance(col_tops: List[int], shape_type: str, rotation: int, x: int, y: int) -> Optional[int]:
+    """Fall distance of a piece at (x, y) straight from column tops
+
+    Only valid while every column of the piece is still above the stack; returns
+    None when the piece is tucked under an overhang.
+    """
+    distance: int = min(col_tops[x + dc] - (y + br + 1)
+                        for dc, br in PIECE_BOTTOM[shape_type][rotation].items())
+    return distance if distance >= 0 else None
+
+
+def drop_piece(rows: List[int], full_row: int, shape_type: str, rotation: int,
+               x: int, y: int = 0, col_tops: Optional[List[int]] = None) -> Optional[int]:
+    """Hard-drop a piece from (x, y) and stamp it into the rows in place
+
+    Pass the rows' column_tops to find the landing row without stepping down.
+    Returns the row it landed on, or None (rows untouched) if it does not fit at (x, y).
+    """
+    if not piece_fits(rows, full_row, shape_type, rotation, x, y):
+        return None
+    distance: Optional[int] = None
+    if col_tops is not None:
+        distance = landing_distance(col_tops, shape_type, rotation, x, y)
+    if distance is None:
+        distance = drop_distance(rows, shape_type, rotation, x, y)
+    y += distance
+    stamp_piece(rows, full_row, shape_type, rotation, x, y)
+    return y
+
+
+def erase_piece(rows: List[int], full_row: int, shape_type: str, rotation: int, x: int, y: int) -> None:
+    """Undo stamp_piece: clear a piece's cells from the rows in place"""
+    height: int = len(rows)
+    for r, bits in enumerate(SHAPE_BITS[shape_type][rotation]):
+        row_y: int = y + r
+        if 0 <= row_y < height:
+            shifted: int = bits << x if x >= 0 else bits >> -x
+            rows[row_y] &= ~shifted
+
+
+def clear_full_rows(rows: List[int], full_row: int) -> Tuple[List[int], List[int]]:
+    """Return (new rows, cleared row indices) with full rows removed and empty rows on top"""
+    cleared: List[int] = [r for r, bits in enumerate(rows) if bits == full_row]
+    if not cleared:
+        return rows, cleared
+    remaining: List[int] = [bits for bits in rows if bits != full_row]
+    return [0] * len(cleared) + remaining, cleared
+
 
 class Tetromino:
     """Represents a Tetris piece (tetromino)"""
 
+    __slots__ = ('type', 'shapes', 'rotation', 'shape', 'color', 'x', 'y')
+
     def __init__(self, shape_type: str) -> None:
         if shape_type not in SHAPES:
             raise ValueError(f"Invalid shape type: {shape_type}")
@@ -114,23 +306,31 @@ class Tetromino:
 
     def get_cells(self) -> List[Tuple[int, int]]:
         """Get list of occupied cells"""
-        cells: List[Tuple[int, int]] = []
-        for r, row in enumerate(self.shape):
-            for c, val in enumerate(row):
-                if val:
-                    cells.append((self.y + r, self.x + c))
-        return cells
+        return [(self.y + r, self.x + c) for r, c in SHAPE_CELLS[self.type][self.rotation]]
 
 
 class TetrisGame:
     """Main Tetris game logic and state management"""
 
+    # fall_speed is a property over fall_speed_ns, so it has no slot of its own
+    __slots__ = ('width', 'height', 'rows', 'full_row', 'col_heights', 'board',
+                 'score', 'level', 'lines_cleared', 'game_over', 'paused',
+                 '_bag', 'current_piece', 'next_piece', 'fall_speed_ns', 'last_fall_time_ns',
+                 '_prev_display', '_prev_preview', '_prev_footer',
+                 '_top_border', '_title_row', '_mid_border', '_bottom_border')
+
     def __init__(self, width: int = 10, height: int = 20) -> None:
         if width < 4 or height < 4:
             raise ValueError("Board dimensions must be at least 4x4")
 
         self.width: int = width
         self.height: int = height
+        # Bitboard: one int per row, bit c set when column c is filled
+        self.rows: List[int] = [0] * height
+        self.full_row: int = (1 << width) - 1
+        # Topmost filled row per column (height when the column is empty)
+        self.col_heights: List[int] = [height] * width
+        # Parallel color grid, used for rendering only
         self.board: List[List[str]] = [[' ' for _ in range(width)] for _ in range(height)]
         self.score: int = 0
         self.level: int = 1
@@ -138,62 +338,132 @@ class TetrisGame:
         self.game_over: bool = False
         self.paused: bool = False
 
+        # 7-bag randomizer: every piece type once per shuffled bag
+        self._bag: List[str] = []
         self.current_piece: Tetromino = self.spawn_piece()
         self.next_piece: Tetromino = self.spawn_piece()
 
-        # Game speed
-        self.fall_speed: float = 0.8
-        self.last_fall_time: float = time.time()
+        # Game speed, kept as integer nanoseconds on the monotonic clock
+        self.fall_speed_ns: int = LEVEL_FALL_NS[0]
+        self.last_fall_time_ns: int = time.monotonic_ns()
+
+        # Last rendered frame, for differential redraws (None forces a full repaint)
+        self._prev_display: Optional[List[List[bytes]]] = None
+        self._prev_preview: List[bytes] = []
+        self._prev_footer: List[str] = []
+
+        # Border and title lines depend only on the board width
+        # Board section between ║ symbols: space(1) + marker(1) + cells(width) + marker(1) = width + 3
+        # Next section between ║ symbols: spaces(2) + content(6) + spaces(2) = 10
+        board_display_width: int = width + 3
+        next_display_width: int = 10
+        title_padding_left = (board_display_width - 6) // 2
+        title_padding_right = board_display_width - 6 - title_padding_left
+        next_padding_left = (next_display_width - 4) // 2
+        next_padding_right = next_display_width - 4 - next_padding_left
+        self._top_border: str = "╔" + "═" * board_display_width + "╦" + "═" * next_display_width + "╗"
+        self._title_row: str = ("║" + " " * title_padding_left + "TETRIS" + " " * title_padding_right
+                                + "║" + " " * next_padding_left + "NEXT" + " " * next_padding_right + "║")
+        self._mid_border: str = "╠" + "═" * board_display_width + "╣" + "═" * next_display_width + "╣"
+        self._bottom_border: str = "╚" + "═" * board_display_width + "╩" + "═" * next_display_width + "╝"
+
+    @property
+    def fall_speed(self) -> float:
+        """Seconds between automatic drops"""
+        return self.fall_speed_ns / 1e9
+
+    @fall_speed.setter
+    def fall_speed(self, seconds: float) -> None:
+        self.fall_speed_ns = round(seconds * 1e9)
 
     def spawn_piece(self) -> Tetromino:
-        """Spawn a new random piece centered on the board, starting from above"""
-        shape_type: str = random.choice(list(SHAPES.keys()))
+        """Spawn the next piece from the 7-bag, centered on the board, starting from above"""
+        if not self._bag:
+            self._bag = list(SHAPE_TYPES)
+            random.shuffle(self._bag)
+        shape_type: str = self._bag.pop()
         piece: Tetromino = Tetromino(shape_type)
         # Center the piece horizontally based on board width
-        piece.x = (self.width - len(piece.shape[0])) // 2
+        piece.x = (self.width - SHAPE_WIDTH[shape_type][0]) // 2
         # Start the piece slightly above the board so it falls into view
         piece.y = -2
         return piece
 
     def valid_position(self, piece: Tetromino, offset_x: int = 0, offset_y: int = 0) -> bool:
         """Check if piece position is valid"""
-        for r, row in enumerate(piece.shape):
-            for c, val in enumerate(row):
-                if val:
-                    new_y: int = piece.y + r + offset_y
-                    new_x: int = piece.x + c + offset_x
-
-                    # Check boundaries
-                    if new_x < 0 or new_x >= self.width or new_y >= self.height:
-                        return False
-
-                    # Check collision with placed pieces
-                    if new_y >= 0 and self.board[new_y][new_x] != ' ':
-                        return False
-        return True
+        return piece_fits(self.rows, self.full_row, piece.type, piece.rotation,
+                          piece.x + offset_x, piece.y + offset_y)
 
     def place_piece(self) -> None:
         """Place current piece on board"""
-        for r, row in enumerate(self.current_piece.shape):
-            for c, val in enumerate(row):
-                if val:
-                    y: int = self.current_piece.y + r
-                    x: int = self.current_piece.x + c
-                    if 0 <= y < self.height and 0 <= x < self.width:
-                        self.board[y][x] = self.current_piece.color
+        piece: Tetromino = self.current_piece
+        stamp_piece(self.rows, self.full_row, piece.type, piece.rotation, piece.x, piece.y)
+
+        board: List[List[str]] = self.board
+        col_heights: List[int] = self.col_heights
+        width: int = self.width
+        height: int = self.height
+        color: str = piece.color
+        cells: List[Tuple[int, int]] = piece.get_cells()
+
+        for y, x in cells:
+            if 0 <= y < height and 0 <= x < width:
+                board[y][x] = color
+                if y < col_heights[x]:
+                    col_heights[x] = y
+
+    def snapshot(self) -> GameSnapshot:
+        """Capture the full game state cheaply for a later restore()
+
+        This is the supported way to clone a game for lookahead; avoid copy.deepcopy.
+        """
+        piece: Tetromino = self.current_piece
+        next_piece: Tetromino = self.next_piece
+        return (self.rows[:], [row[:] for row in self.board], self.col_heights[:],
+                self.score, self.level, self.lines_cleared, self.game_over,
+                self.fall_speed_ns, self.last_fall_time_ns, self._bag[:],
+                piece.type, piece.rotation, piece.x, piece.y,
+                next_piece.type, next_piece.x, next_piece.y)
+
+    def restore(self, snap: GameSnapshot) -> None:
+        """Restore the game state captured by snapshot(), undoing any moves and locks since"""
+        (rows, board, col_heights, self.score, self.level, self.lines_cleared, self.game_over,
+         self.fall_speed_ns, self.last_fall_time_ns, bag,
+         piece_type, rotation, x, y, next_type, next_x, next_y) = snap
+        # Copies keep the snapshot reusable
+        self.rows = rows[:]
+        self.board = [row[:] for row in board]
+        self.col_heights = col_heights[:]
+        self._bag = bag[:]
+
+        piece: Tetromino = self.current_piece
+        if piece.type != piece_type:
+            piece = Tetromino(piece_type)
+            self.current_piece = piece
+        piece.rotation = rotation
+        piece.shape = piece.shapes[rotation]
+        piece.x = x
+        piece.y = y
+
+        if self.next_piece.type != next_type:
+            self.next_piece = Tetromino(next_type)
+        self.next_piece.x = next_x
+        self.next_piece.y = next_y
+
+    def _recompute_col_heights(self) -> None:
+        """Rebuild col_heights with a single top-down pass over the bitboard"""
+        self.col_heights = column_tops(self.rows, self.full_row)
 
     def clear_lines(self) -> int:
         """Clear completed lines and return number cleared"""
-        lines_to_clear: List[int] = []
+        self.rows, lines_to_clear = clear_full_rows(self.rows, self.full_row)
 
-        for r in range(self.height):
-            if all(cell != ' ' for cell in self.board[r]):
-                lines_to_clear.append(r)
-
-        # Remove cleared lines and add new empty lines at top
-        for r in lines_to_clear:
-            del self.board[r]
-            self.board.insert(0, [' ' for _ in range(self.width)])
+        # Mirror the clear on the color grid: new empty lines on top, surviving lines below
+        if lines_to_clear:
+            cleared = set(lines_to_clear)
+            self.board = ([[' ' for _ in range(self.width)] for _ in lines_to_clear]
+                          + [row for r, row in enumerate(self.board) if r not in cleared])
+            self._recompute_col_heights()
 
         # Update score
         num_lines: int = len(lines_to_clear)
@@ -206,7 +476,7 @@ class TetrisGame:
             # Level up every 10 lines
             self.level = self.lines_cleared // 10 + 1
             # Note: fall_speed may be overridden by AI mode in play_game()
-            self.fall_speed = max(0.1, 0.8 - (self.level - 1) * 0.05)
+            self.fall_speed_ns = LEVEL_FALL_NS[min(self.level, MAX_SPEED_LEVEL) - 1]
 
         return num_lines
 
@@ -227,10 +497,17 @@ class TetrisGame:
             return True
         return False
 
+    def _drop_distance(self) -> int:
+        """Rows the current piece can fall before it lands"""
+        piece: Tetromino = self.current_piece
+        distance: Optional[int] = landing_distance(self.col_heights, piece.type, piece.rotation, piece.x, piece.y)
+        if distance is not None:
+            return distance
+        return drop_distance(self.rows, piece.type, piece.rotation, piece.x, piece.y)
+
     def hard_drop(self) -> None:
         """Drop piece all the way down"""
-        while self.move_down():
-            pass
+        self.current_piece.y += self._drop_distance()
         self.lock_piece()
 
     def rotate(self) -> None:
@@ -240,10 +517,10 @@ class TetrisGame:
 
         if not self.valid_position(self.current_piece):
             # Try wall kicks
-            for offset in [(-1, 0), (1, 0), (0, -1), (-2, 0), (2, 0)]:
-                if self.valid_position(self.current_piece, offset[0], offset[1]):
-                    self.current_piece.x += offset[0]
-                    self.current_piece.y += offset[1]
+            for dx, dy in WALL_KICKS:
+                if self.valid_position(self.current_piece, dx, dy):
+                    self.current_piece.x += dx
+                    self.current_piece.y += dy
                     return
 
             # If no valid position, revert rotation
@@ -260,7 +537,7 @@ class TetrisGame:
         self.next_piece = self.spawn_piece()
 
         # Reset fall timer for new piece
-        self.last_fall_time = time.time()
+        self.last_fall_time_ns = time.monotonic_ns()
 
         # Check game over
         if not self.valid_position(self.current_piece):
@@ -272,105 +549,112 @@ class TetrisGame:
             return
 
         # Auto fall
-        current_time: float = time.time()
-        if current_time - self.last_fall_time >= self.fall_speed:
+        now: int = time.monotonic_ns()
+        if now - self.last_fall_time_ns >= self.fall_speed_ns:
             if not self.move_down():
                 self.lock_piece()
-            self.last_fall_time = current_time
-
-    def render(self) -> None:
-        """Render game screen with colors"""
-        clear_screen()
-
-        # Create display board with current piece
-        display: List[List[str]] = [row[:] for row in self.board]
+            self.last_fall_time_ns = now
 
-        # Add current piece to display
-        for r, row in enumerate(self.current_piece.shape):
-            for c, val in enumerate(row):
-                if val:
-                    y: int = self.current_piece.y + r
-                    x: int = self.current_piece.x + c
-                    if 0 <= y < self.height and 0 <= x < self.width:
-                        display[y][x] = self.current_piece.color
-
-        # Calculate dynamic border widths
-        # Board section between ║ symbols: space(1) + marker(1) + cells(width) + marker(1) = width + 3
-        # Next section between ║ symbols: spaces(2) + content(6) + spaces(2) = 10
-        board_display_width: int = self.width + 3
-        next_display_width: int = 10
-
-        # Print game info
-        print("╔" + "═" * board_display_width + "╦" + "═" * next_display_width + "╗")
-        title_padding_left = (board_display_width - 6) // 2
-        title_padding_right = board_display_width - 6 - title_padding_left
-        next_padding_left = (next_display_width - 4) // 2
-        next_padding_right = next_display_width - 4 - next_padding_left
-        print("║" + " " * title_padding_left + "TETRIS" + " " * title_padding_right + "║" + " " * next_padding_left + "NEXT" + " " * next_padding_right + "║")
-        print("╠" + "═" * board_display_width + "╣" + "═" * next_display_width + "╣")
-
-        # Print game board and next piece side by side
-        spawn_zone_height = 3  # Top 3 rows are spawn zone
+    def _frame_skeleton(self) -> str:
+        """Static parts of the screen: borders, titles and spawn zone markers"""
+        lines: List[str] = [self._top_border, self._title_row, self._mid_border]
 
         for i in range(self.height):
-            # Game board
-            line: str = "║ "
-
             # Add spawn zone indicator for top rows
-            if i < spawn_zone_height:
-                line += Color.GRAY + "┊" + Color.RESET
-            else:
-                line += " "
+            marker: str = SPAWN_MARK if i < SPAWN_ZONE_HEIGHT else " "
+            lines.append("║ " + marker + " " * self.width + marker + "║" + " " * 10 + "║")
 
-            for cell in display[i]:
-                if cell == ' ':
-                    line += Color.GRAY + '·' + Color.RESET
-                else:
-                    line += cell + '█' + Color.RESET
+        lines.append(self._bottom_border)
+        return "\n".join(lines)
 
-            # Add spawn zone indicator on right
-            if i < spawn_zone_height:
-                line += Color.GRAY + "┊" + Color.RESET + "║"
-            else:
-                line += " ║"
-
-            # Next piece preview (only first 4 rows)
-            if i < 4:
-                line += "  "
-                if i < len(self.next_piece.shape):
-                    for val in self.next_piece.shape[i]:
-                        if val:
-                            line += self.next_piece.color + '█' + Color.RESET
-                        else:
-                            line += ' '
-                    # Pad to width 6
-                    line += ' ' * (6 - len(self.next_piece.shape[i]))
-                else:
-                    line += ' ' * 6
-                line += "  ║"
-            else:
-                # Match the width of rows 0-3: 2 + 6 + 2 = 10 spaces total
-                line += " " * 10 + "║"
+    def render(self, status_line: str = "") -> None:
+        """Render game screen with colors, redrawing only what changed since the last frame"""
+        width: int = self.width
+        height: int = self.height
+        cell_bytes: Dict[str, bytes] = CELL_BYTES
+        current_piece: Tetromino = self.current_piece
+        next_shape: List[List[int]] = self.next_piece.shape
 
-            print(line)
-
-        # Bottom border
-        print("╚" + "═" * board_display_width + "╩" + "═" * next_display_width + "╝")
-
-        # Game stats
-        print()
-        print(f"Score: {self.score}  |  Level: {self.level}  |  Lines: {self.lines_cleared}")
-        print()
-        print("Controls: ← → : Move  |  ↑/W : Rotate  |  ↓/S : Soft Drop  |  Space : Hard Drop")
-        print("          P : Pause  |  I : AI Mode  |  Q : Quit")
+        # Create display board with current piece
+        display: List[List[bytes]] = [[cell_bytes[cell] for cell in row] for row in self.board]
 
+        # Add current piece to display
+        piece_cell: bytes = cell_bytes[current_piece.color]
+        for y, x in current_piece.get_cells():
+            if 0 <= y < height and 0 <= x < width:
+                display[y][x] = piece_cell
+
+        # Next piece preview, padded to width 6
+        next_cell: bytes = cell_bytes[self.next_piece.color]
+        preview: List[bytes] = []
+        for i in range(4):
+            if i < len(next_shape):
+                row = next_shape[i]
+                preview.append(b"".join(next_cell if val else b' ' for val in row) + b' ' * (6 - len(row)))
+            else:
+                preview.append(b' ' * 6)
+
+        # Game stats and messages below the board
+        footer: List[str] = [
+            "",
+            f"Score: {self.score}  |  Level: {self.level}  |  Lines: {self.lines_cleared}",
+            "",
+            "Controls: ← → : Move  |  ↑/W : Rotate  |  ↓/S : Soft Drop  |  Space : Hard Drop",
+            "          P : Pause  |  I : AI Mode  |  Q : Quit",
+        ]
         if self.paused:
-            print("\n*** PAUSED ***")
-
+            footer += ["", "*** PAUSED ***"]
         if self.game_over:
-            print("\n*** GAME OVER ***")
-            print(f"Final Score: {self.score}")
-            print("Press R to restart or Q to quit")
+            footer += ["", "*** GAME OVER ***", f"Final Score: {self.score}", "Press R to restart or Q to quit"]
+        if status_line:
+            footer += ["", status_line]
+
+        out: List[bytes] = []
+        emit = out.append
+
+        # First paint: clear the screen, draw the static frame, and treat every cell as changed
+        prev_display: Optional[List[List[bytes]]] = self._prev_display
+        prev_preview: List[bytes] = self._prev_preview
+        prev_footer: List[str] = self._prev_footer
+        if prev_display is None:
+            emit(b"\033[H\033[2J\033[3J")
+            emit(self._frame_skeleton().encode())
+            prev_display = [[b''] * width for _ in range(height)]
+            prev_preview = [b''] * 4
+            prev_footer = []
+
+        # Terminal positions are 1-based; board rows start below the 3 header lines,
+        # cells start after "║ " and the spawn marker
+        for y in range(height):
+            row, prev_row = display[y], prev_display[y]
+            if row != prev_row:
+                for x in range(width):
+                    if row[x] != prev_row[x]:
+                        emit(b"\033[%d;%dH%s" % (y + 4, x + 4, row[x]))
+
+        # Preview sits after the board's right border and two spaces
+        for i in range(4):
+            if preview[i] != prev_preview[i]:
+                emit(b"\033[%d;%dH%s" % (i + 4, width + 8, preview[i]))
+
+        footer_top: int = height + 5
+        for i, line in enumerate(footer):
+            if i >= len(prev_footer) or line != prev_footer[i]:
+                emit(b"\033[%d;1H%s\033[K" % (footer_top + i, line.encode()))
+        if len(footer) < len(prev_footer):
+            emit(b"\033[%d;1H\033[J" % (footer_top + len(footer)))
+
+        # Leave the cursor below the frame
+        emit(b"\033[%d;1H" % (footer_top + len(footer)))
+
+        self._prev_display = display
+        self._prev_preview = preview
+        self._prev_footer = footer
+
+        # Flush any pending text output first so the raw byte write stays in order
+        sys.stdout.flush()
+        sys.stdout.buffer.write(b"".join(out))
+        sys.stdout.buffer.flush()
 
 
 def get_terminal_size() -> Tuple[int, int]:
@@ -419,14 +703,45 @@ def clear_screen() -> None:
     sys.stdout.flush()
 
 
-def get_key_non_blocking() -> Optional[str]:
-    """Get keyboard input without blocking"""
+def read_keys() -> bytes:
+    """Read all pending keyboard input without blocking"""
     try:
         if select.select([sys.stdin], [], [], 0)[0]:
-            return sys.stdin.read(1)
+            return os.read(sys.stdin.fileno(), 64)
     except Exception:
         pass
-    return None
+    return b''
+
+
+# Final byte of an arrow key escape sequence (ESC [ X) mapped to a logical key
+ARROW_KEYS: Dict[int, str] = {ord('A'): 'up', ord('B'): 'down', ord('C'): 'right', ord('D'): 'left'}
+
+
+def parse_keys(data: bytes) -> Tuple[List[str], bytes]:
+    """Split raw input into logical keys: single characters, or 'up'/'down'/'left'/'right' for arrows
+
+    Also returns any escape sequence cut off at the end of the data (ESC or ESC [),
+    to be prepended to the next read so the arrow is not lost.
+    """
+    keys: List[str] = []
+    i: int = 0
+    while i < len(data):
+        if data[i] == 0x1b:
+            # The rest of the sequence has not arrived yet
+            if data[i + 1:] in (b'', b'['):
+                return keys, data[i:]
+            # Arrow keys arrive as ESC [ A-D; other escape sequences are ignored
+            if data[i + 1] == ord('['):
+                arrow: Optional[str] = ARROW_KEYS.get(data[i + 2])
+                if arrow:
+                    keys.append(arrow)
+                i += 3
+            else:
+                i += 1
+            continue
+        keys.append(chr(data[i]))
+        i += 1
+    return keys, b''
 
 
 def play_game(ai_mode: bool = False) -> None:
@@ -449,7 +764,7 @@ def play_game(ai_mode: bool = False) -> None:
 
     # Track when AI should make a move
     ai_move_made: bool = False
-    ai_think_time: float = 0.001  # AI delay (nearly instant for fast gameplay)
+    ai_think_time_ns: int = 1_000_000  # AI delay (nearly instant for fast gameplay)
 
     # Set terminal to raw mode
     try:
@@ -461,14 +776,18 @@ def play_game(ai_mode: bool = False) -> None:
 
     try:
         tty.setcbreak(sys.stdin.fileno())
-        last_ai_move_time: float = time.time()
+        last_ai_move_time_ns: int = time.monotonic_ns()
+        pending_input: bytes = b''  # Partial escape sequence held over from the last frame
 
         while True:
             # Handle input
-            key: Optional[str] = get_key_non_blocking()
+            quit_requested: bool = False
+            restarted: bool = False
 
-            if key:
+            keys, pending_input = parse_keys(pending_input + read_keys())
+            for key in keys:
                 if key.lower() == 'q':
+                    quit_requested = True
                     break
                 elif key.lower() == 'p':
                     game.paused = not game.paused
@@ -483,7 +802,7 @@ def play_game(ai_mode: bool = False) -> None:
                         game.fall_speed = 0.05  # Fast for AI
                     else:
                         # Restore level-appropriate speed for manual play
-                        game.fall_speed = max(0.1, 0.8 - (game.level - 1) * 0.05)
+                        game.fall_speed_ns = LEVEL_FALL_NS[min(game.level, MAX_SPEED_LEVEL) - 1]
                 elif key.lower() == 'r' and game.game_over:
                     try:
                         # Recalculate board size in case terminal was resized
@@ -498,52 +817,41 @@ def play_game(ai_mode: bool = False) -> None:
                             game.fall_speed = 0.05  # Fast for AI
                     except ValueError as e:
                         print(f"Error restarting game: {e}")
-                        break
-                    continue
+                        quit_requested = True
+                    restarted = True
+                    break
 
                 # Manual controls (only when AI is off)
                 if not ai_mode and not game.game_over and not game.paused:
                     if key == ' ':  # Space for hard drop
                         game.hard_drop()
-                    elif key == 'w' or key == '\x1b':  # W or arrow key
-                        if key == '\x1b':
-                            try:
-                                next1: str = sys.stdin.read(1)
-                                if next1 == '[':
-                                    next2: str = sys.stdin.read(1)
-                                    if next2 == 'A':  # Up arrow
-                                        game.rotate()
-                                    elif next2 == 'B':  # Down arrow
-                                        game.move_down()
-                                        game.last_fall_time = time.time()
-                                    elif next2 == 'C':  # Right arrow
-                                        game.move_right()
-                                    elif next2 == 'D':  # Left arrow
-                                        game.move_left()
-                            except Exception:
-                                pass
-                        else:  # W key
-                            game.rotate()
-                    elif key == 'a':
+                    elif key == 'w' or key == 'up':
+                        game.rotate()
+                    elif key == 'a' or key == 'left':
                         game.move_left()
-                    elif key == 'd':
+                    elif key == 'd' or key == 'right':
                         game.move_right()
-                    elif key == 's':
+                    elif key == 's' or key == 'down':
                         game.move_down()
-                        game.last_fall_time = time.time()
+                        game.last_fall_time_ns = time.monotonic_ns()
+
+            if quit_requested:
+                break
+            if restarted:
+                continue
 
             # AI logic
             if ai_mode and ai and not game.game_over and not game.paused:
-                current_time = time.time()
+                now = time.monotonic_ns()
                 # Check if a new piece has spawned and AI hasn't moved yet
                 # Wait for piece to be fully visible (y >= 1) to avoid simultaneous spawn/drop appearance
-                if not ai_move_made and game.current_piece.y >= 1 and current_time - last_ai_move_time >= ai_think_time:
+                if not ai_move_made and game.current_piece.y >= 1 and now - last_ai_move_time_ns >= ai_think_time_ns:
                     best_move = ai.get_best_move()
                     if best_move:
                         try:
                             ai.execute_move(best_move)
                             ai_move_made = True
-                            last_ai_move_time = current_time
+                            last_ai_move_time_ns = now
                         except Exception:
                             # If AI move fails, just continue
                             ai_move_made = False
@@ -562,14 +870,8 @@ def play_game(ai_mode: bool = False) -> None:
             else:
                 game.update()
 
-            # Render game
-            game.render()
-
-            # Display AI mode status
-            if ai_mode:
-                print(f"\n{Color.GREEN}[SURVIVAL AI - NEVER LOSE MODE - TURBO]{Color.RESET} Press 'I' for manual")
-            else:
-                print(f"\n[MANUAL MODE] - Press 'I' to enable SURVIVAL AI")
+            # Render game with AI mode status
+            game.render(AI_STATUS_LINE if ai_mode else MANUAL_STATUS_LINE)
 
             # Frame delay - faster when AI is playing
             if ai_mode:
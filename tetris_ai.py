@@ -25,135 +25,194 @@ NORMAL MODE (board < 60% full):
 
 This AI should survive indefinitely on most difficulty levels!
 """
+from operator import mul
+from types import ModuleType
 from typing import List, Tuple, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from tetris import TetrisGame, Tetromino
 
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+    def _popcount(bits: int) -> int:
+        """Number of set bits"""
+        return bin(bits).count('1')
+
+# Highest values of the two heuristics that reward a board
+PERFECT_WELL_SCORE = 10.0     # I-well of the right depth
+CLEAN_WELL_MULTIPLIER = 1.5   # Bonus for a well with no holes in its column
+MAX_WELL_QUALITY_SCORE = PERFECT_WELL_SCORE * CLEAN_WELL_MULTIPLIER
+TETRIS_READY_SCORE = 50.0     # Four rows an I-piece would clear at once
+
+# Heuristic weights, in evaluate_board's feature order
+# PANIC MODE - extreme penalties for danger
+PANIC_WEIGHTS: Tuple[float, ...] = (
+    -2.0,   # height: Minimize height aggressively
+    1.5,    # lines: Clear lines urgently
+    -10.0,  # holes: NO HOLES ALLOWED in panic
+    -1.0,   # bumpiness: Keep flat
+    -5.0,   # max height: Absolutely minimize max height
+    -2.0,   # wells: No deep wells
+    -0.5,   # row transitions
+    -0.3,   # column transitions
+    -15.0,  # pits: Pits are deadly in panic mode
+    0.0,    # I-well: ignored in danger mode
+    0.0,    # TETRIS readiness: ignored in danger mode
+)
+# NORMAL MODE - balanced play with I-well strategy
+NORMAL_WEIGHTS: Tuple[float, ...] = (
+    -0.8,   # height: Keep height down (increased from 0.51)
+    1.2,    # lines: Reward line clears (increased from 0.76)
+    -5.0,   # holes: MASSIVELY penalize holes (was 0.35)
+    -0.3,   # bumpiness: Some bumpiness OK
+    -1.5,   # max height: Keep max height low (was 0.5)
+    -0.5,   # wells: General wells OK
+    -0.15,  # row transitions
+    -0.1,   # column transitions
+    -8.0,   # pits: Pits very bad (was 0.65)
+    0.3,    # I-well (reduced from 0.8)
+    0.8,    # TETRIS opportunity (reduced from 1.5)
+)
+
+# Largest value of each feature, in evaluate_board's order, on a board with no
+# full rows (lookahead boards are always cleared first); None where there is no
+# fixed cap. Every feature is non-negative, so negative weights only lower a score
+CLEARED_BOARD_FEATURE_CAPS: Tuple[Optional[float], ...] = (
+    None,                    # height
+    0.0,                     # lines: none left once full rows are cleared
+    None, None, None, None,  # holes, bumpiness, max height, wells
+    None, None, None,        # row transitions, column transitions, pits
+    MAX_WELL_QUALITY_SCORE,  # I-well
+    TETRIS_READY_SCORE,      # TETRIS readiness
+)
+
+
+def _max_cleared_board_score(weights: Tuple[float, ...]) -> float:
+    """Upper bound on evaluate_board for a board with no full rows under the given weights"""
+    bound = 0.0
+    for weight, cap in zip(weights, CLEARED_BOARD_FEATURE_CAPS):
+        if weight > 0.0:
+            if cap is None:
+                return float('inf')  # Rewarding an uncapped feature leaves no finite bound
+            bound += weight * cap
+    return bound
+
+
+# Highest score evaluate_board can give a board with no full rows
+MAX_CLEARED_BOARD_SCORE = max(_max_cleared_board_score(PANIC_WEIGHTS),
+                              _max_cleared_board_score(NORMAL_WEIGHTS))
+# Most the next piece can add to a combined lookahead score
+MAX_NEXT_PIECE_BONUS = 0.4 * MAX_CLEARED_BOARD_SCORE
+
 
 class TetrisAI:
     """AI player for Tetris using heuristic evaluation"""
 
     def __init__(self, game: 'TetrisGame') -> None:
         self.game: 'TetrisGame' = game
+        # tetris imports this module while it loads, so its board helpers are
+        # bound here, once per AI, rather than imported inside every search
+        import tetris
+        self._tetris: ModuleType = tetris
+
+    # Boards are lists of row bitmasks, as in TetrisGame.rows: bit c of board[r]
+    # is set when column c of row r is filled. Row 0 is the top of the board.
 
-    def evaluate_board(self, board: List[List[str]], piece_type: Optional[str] = None) -> float:
+    def evaluate_board(self, board: List[int], piece_type: Optional[str] = None) -> float:
         """Evaluate board state using multiple heuristics (higher is better)"""
-        height_score = self._aggregate_height(board)
+        # Board dimensions and column heights are shared by the heuristics below
+        board_height = len(board)
+        board_width = self.game.width
+        heights = self._get_column_heights(board, board_height, board_width)
+
+        height_score = self._aggregate_height(heights)
         holes_score = self._count_holes(board)
-        bumpiness_score = self._calculate_bumpiness(board)
+        bumpiness_score = self._calculate_bumpiness(heights, board_width)
         lines_score = self._count_complete_lines(board)
-        max_height_score = self._get_max_height(board)
-        wells_score = self._count_wells(board)
-        row_transitions_score = self._count_row_transitions(board)
-        col_transitions_score = self._count_column_transitions(board)
-        pit_score = self._count_pits(board)
+        max_height_score = self._get_max_height(heights)
+        wells_score = self._count_wells(heights, board_height)
+        row_transitions_score = self._count_row_transitions(board, board_width)
+        col_transitions_score = self._count_column_transitions(board, board_height)
+        pit_score = self._count_pits(board, board_width)
 
         # NEW: I-piece well management heuristics (only when safe)
-        board_height = len(board)
-        max_height = self._get_max_height(board)
-        is_dangerous = max_height > board_height * 0.6  # Board > 60% full
+        is_dangerous = max_height_score > board_height * 0.6  # Board > 60% full
 
         # Only use I-well strategy when board is safe
         if not is_dangerous:
-            well_quality_score = self._evaluate_well_quality(board)
-            tetris_ready_score = self._evaluate_tetris_readiness(board, piece_type)
+            well_quality_score = self._evaluate_well_quality(board, heights, board_height, board_width)
+            tetris_ready_score = self._evaluate_tetris_readiness(board, heights, piece_type,
+                                                                 board_height, board_width)
         else:
             # In danger mode, ignore I-well strategy
             well_quality_score = 0
             tetris_ready_score = 0
 
         # SURVIVAL MODE: If board is dangerous, heavily prioritize safety
-        if is_dangerous:
-            # PANIC MODE - extreme penalties for danger
-            score = (
-                -2.0 * height_score +            # Minimize height aggressively
-                1.5 * lines_score +              # Clear lines urgently
-                -10.0 * holes_score +            # NO HOLES ALLOWED in panic
-                -1.0 * bumpiness_score +         # Keep flat
-                -5.0 * max_height_score +        # Absolutely minimize max height
-                -2.0 * wells_score +             # No deep wells
-                -0.5 * row_transitions_score +
-                -0.3 * col_transitions_score +
-                -15.0 * pit_score                # Pits are deadly in panic mode
-            )
-        else:
-            # NORMAL MODE - balanced play with I-well strategy
-            score = (
-                -0.8 * height_score +            # Keep height down (increased from 0.51)
-                1.2 * lines_score +              # Reward line clears (increased from 0.76)
-                -5.0 * holes_score +             # MASSIVELY penalize holes (was 0.35)
-                -0.3 * bumpiness_score +         # Some bumpiness OK
-                -1.5 * max_height_score +        # Keep max height low (was 0.5)
-                -0.5 * wells_score +             # General wells OK
-                -0.15 * row_transitions_score +
-                -0.1 * col_transitions_score +
-                -8.0 * pit_score +               # Pits very bad (was 0.65)
-                0.3 * well_quality_score +       # I-well (reduced from 0.8)
-                0.8 * tetris_ready_score         # TETRIS opportunity (reduced from 1.5)
-            )
-
-        return score
-
-    def _get_max_height(self, board: List[List[str]]) -> float:
+        features = (
+            height_score, lines_score, holes_score, bumpiness_score, max_height_score, wells_score,
+            row_transitions_score, col_transitions_score, pit_score, well_quality_score, tetris_ready_score,
+        )
+        weights = PANIC_WEIGHTS if is_dangerous else NORMAL_WEIGHTS
+        return sum(map(mul, weights, features))
+
+    def _get_max_height(self, heights: List[int]) -> float:
         """Get the maximum column height"""
-        heights = self._get_column_heights(board)
         return float(max(heights)) if heights else 0.0
 
-    def _get_column_heights(self, board: List[List[str]]) -> List[int]:
+    def _get_column_heights(self, board: List[int], board_height: int, board_width: int) -> List[int]:
         """Get the height of each column"""
-        heights: List[int] = []
-        for col in range(len(board[0])):
-            height = 0
-            for row in range(len(board)):
-                if board[row][col] != ' ':
-                    height = len(board) - row
+        # Scan rows top-down; the first row holding a column's bit is its top
+        heights: List[int] = [0] * board_width
+        remaining = (1 << board_width) - 1  # Columns whose top is not found yet
+        for row in range(board_height):
+            new_tops = board[row] & remaining
+            if new_tops:
+                remaining ^= new_tops
+                while new_tops:
+                    low = new_tops & -new_tops
+                    heights[low.bit_length() - 1] = board_height - row
+                    new_tops ^= low
+                if not remaining:
                     break
-            heights.append(height)
         return heights
 
-    def _aggregate_height(self, board: List[List[str]]) -> float:
+    def _aggregate_height(self, heights: List[int]) -> float:
         """Sum of all column heights"""
-        heights = self._get_column_heights(board)
         return float(sum(heights))
 
-    def _count_holes(self, board: List[List[str]]) -> float:
+    def _count_holes(self, board: List[int]) -> float:
         """Count empty cells with filled cells above them"""
         holes = 0
-        for col in range(len(board[0])):
-            found_block = False
-            for row in range(len(board)):
-                if board[row][col] != ' ':
-                    found_block = True
-                elif found_block and board[row][col] == ' ':
-                    holes += 1
+        seen = 0  # Columns with a block somewhere above the current row
+        for row in board:
+            holes += _popcount(seen & ~row)
+            seen |= row
         return float(holes)
 
-    def _calculate_bumpiness(self, board: List[List[str]]) -> float:
+    def _calculate_bumpiness(self, heights: List[int], board_width: int) -> float:
         """Sum of absolute height differences between adjacent columns"""
-        heights = self._get_column_heights(board)
         bumpiness = 0
-        for i in range(len(heights) - 1):
+        for i in range(board_width - 1):
             bumpiness += abs(heights[i] - heights[i + 1])
         return float(bumpiness)
 
-    def _count_complete_lines(self, board: List[List[str]]) -> float:
+    def _count_complete_lines(self, board: List[int]) -> float:
         """Count number of complete lines"""
-        complete_lines = 0
-        for row in board:
-            if all(cell != ' ' for cell in row):
-                complete_lines += 1
-        return float(complete_lines)
+        return float(board.count(self.game.full_row))
 
-    def _count_wells(self, board: List[List[str]]) -> float:
+    def _count_wells(self, heights: List[int], board_height: int) -> float:
         """Count wells (columns significantly lower than neighbors)"""
-        heights = self._get_column_heights(board)
         wells = 0
+        # Walls are taller than any column, so edge columns only compare with their inner neighbour
+        wall = board_height + 1
+        padded = [wall] + heights + [wall]
 
-        for i in range(len(heights)):
-            left_height = heights[i - 1] if i > 0 else float('inf')
-            right_height = heights[i + 1] if i < len(heights) - 1 else float('inf')
-            current_height = heights[i]
+        for i in range(1, len(padded) - 1):
+            left_height = padded[i - 1]
+            right_height = padded[i + 1]
+            current_height = padded[i]
 
             # A well is when both neighbors are higher
             if current_height < left_height and current_height < right_height:
@@ -162,55 +221,51 @@ class TetrisAI:
 
         return float(wells)
 
-    def _count_row_transitions(self, board: List[List[str]]) -> float:
+    def _count_row_transitions(self, board: List[int], board_width: int) -> float:
         """Count transitions from filled to empty cells in rows"""
+        # XOR with the row shifted by one marks every column whose right
+        # neighbour differs; the last column has no neighbour (walls don't count)
+        inner_mask = (1 << (board_width - 1)) - 1
         transitions = 0
         for row in board:
-            for i in range(len(row) - 1):
-                if (row[i] == ' ') != (row[i + 1] == ' '):
-                    transitions += 1
+            transitions += _popcount((row ^ (row >> 1)) & inner_mask)
         return float(transitions)
 
-    def _count_column_transitions(self, board: List[List[str]]) -> float:
+    def _count_column_transitions(self, board: List[int], board_height: int) -> float:
         """Count transitions from filled to empty cells in columns"""
+        # XOR of vertically adjacent rows marks every column that changes between them
         transitions = 0
-        for col in range(len(board[0])):
-            for row in range(len(board) - 1):
-                if (board[row][col] == ' ') != (board[row + 1][col] == ' '):
-                    transitions += 1
+        for row in range(board_height - 1):
+            transitions += _popcount(board[row] ^ board[row + 1])
         return float(transitions)
 
-    def _count_pits(self, board: List[List[str]]) -> float:
+    def _count_pits(self, board: List[int], board_width: int) -> float:
         """Count pits (holes that are very hard to fill)"""
         pits = 0
-        heights = self._get_column_heights(board)
-
-        for col in range(len(board[0])):
-            # Start from the top of this column
-            top_row = len(board) - heights[col] if heights[col] > 0 else len(board)
-
-            for row in range(top_row, len(board)):
-                if board[row][col] == ' ':
-                    # Check if this hole is surrounded (making it a pit)
-                    left_blocked = col == 0 or board[row][col - 1] != ' '
-                    right_blocked = col == len(board[0]) - 1 or board[row][col + 1] != ' '
-
-                    # If blocked on both sides and has blocks above, it's a dangerous pit
-                    if left_blocked and right_blocked:
-                        # Count depth of blocks above this pit
-                        blocks_above = 0
-                        for r in range(row):
-                            if board[r][col] != ' ':
-                                blocks_above += 1
-                        if blocks_above > 0:
-                            pits += 1 + blocks_above  # Worse the deeper it is
+        right_wall = 1 << (board_width - 1)
+        blocks_above = [0] * board_width  # Running count of filled cells above, per column
+        seen = 0
+
+        for row in board:
+            # Holes blocked on both sides (the walls count as blocked) are dangerous pits
+            pit_mask = seen & ~row & ((row << 1) | 1) & ((row >> 1) | right_wall)
+            while pit_mask:
+                low = pit_mask & -pit_mask
+                pits += 1 + blocks_above[low.bit_length() - 1]  # Worse the deeper it is
+                pit_mask ^= low
+
+            seen |= row
+            bits = row
+            while bits:
+                low = bits & -bits
+                blocks_above[low.bit_length() - 1] += 1
+                bits ^= low
 
         return float(pits)
 
-    def _evaluate_well_quality(self, board: List[List[str]]) -> float:
+    def _evaluate_well_quality(self, board: List[int], heights: List[int],
+                               board_height: int, board_width: int) -> float:
         """Evaluate quality of I-piece well (higher is better)"""
-        heights = self._get_column_heights(board)
-        board_width = len(board[0])
 
         # Check left edge and right edge for potential wells
         best_well_score = 0.0
@@ -227,7 +282,7 @@ class TetrisAI:
             if height_diff >= 3:
                 # Reward wells that are the right depth (3-4 blocks)
                 if 3 <= height_diff <= 4:
-                    well_score = 10.0  # Perfect well depth
+                    well_score = PERFECT_WELL_SCORE
                 elif height_diff > 4:
                     well_score = 5.0 - (height_diff - 4) * 0.5  # Too deep, slight penalty
                 else:
@@ -235,35 +290,38 @@ class TetrisAI:
 
                 # Bonus if well is clean (no holes in the column)
                 is_clean = True
-                for row in range(len(board) - well_height, len(board)):
-                    if board[row][col] != ' ':
+                for row in range(board_height - well_height, board_height):
+                    if board[row] >> col & 1:
                         is_clean = False
                         break
 
                 if is_clean:
-                    well_score *= 1.5
+                    well_score *= CLEAN_WELL_MULTIPLIER
 
                 best_well_score = max(best_well_score, well_score)
 
         return best_well_score
 
-    def _evaluate_tetris_readiness(self, board: List[List[str]], piece_type: Optional[str]) -> float:
+    def _evaluate_tetris_readiness(self, board: List[int], heights: List[int], piece_type: Optional[str],
+                                   board_height: int, board_width: int) -> float:
         """Evaluate if board is ready for a TETRIS (4-line clear) with I-piece"""
         if piece_type != 'I':
             return 0.0  # Only relevant when placing I-piece
 
-        heights = self._get_column_heights(board)
-        board_width = len(board[0])
-        board_height = len(board)
+        # Rows an I-piece could complete are missing a single cell; most boards have none
+        if max(map(_popcount, board)) < board_width - 1:
+            return 0.0
 
         # Check for TETRIS opportunity
         # Look for 4 consecutive rows that are nearly complete except for one column
 
         max_tetris_score = 0.0
+        full_row = (1 << board_width) - 1
 
         for col in range(board_width):
             # Check if placing I-piece here would clear 4 lines
             potential_clears = 0
+            gap_row = full_row ^ (1 << col)  # Every cell filled except this column
 
             # Find how high this column is
             col_height = heights[col]
@@ -278,16 +336,13 @@ class TetrisAI:
                 if row < 0 or row >= board_height:
                     continue
 
-                # Count filled cells in this row (excluding target column)
-                filled = sum(1 for c in range(board_width) if c != col and board[row][c] != ' ')
-
                 # If row would be complete with I-piece, count it
-                if filled == board_width - 1 and board[row][col] == ' ':
+                if board[row] == gap_row:
                     potential_clears += 1
 
             # Reward based on number of lines that would clear
             if potential_clears == 4:
-                max_tetris_score = 50.0  # HUGE reward for TETRIS!
+                max_tetris_score = TETRIS_READY_SCORE  # HUGE reward for TETRIS!
             elif potential_clears == 3:
                 max_tetris_score = max(max_tetris_score, 15.0)
             elif potential_clears == 2:
@@ -297,8 +352,6 @@ class TetrisAI:
 
     def get_best_move(self, use_lookahead: bool = True) -> Optional[Tuple[int, int]]:
         """Find the best position and rotation with 2-piece lookahead (reliable and fast)"""
-        from tetris import Tetromino
-
         current_piece = self.game.current_piece
 
         if use_lookahead:
@@ -310,143 +363,110 @@ class TetrisAI:
 
     def _get_best_move_with_2piece_lookahead(self) -> Optional[Tuple[int, int]]:
         """Reliable 2-piece lookahead - evaluates current + next piece"""
-        from tetris import Tetromino
-
-        current_piece = self.game.current_piece
+        tetris = self._tetris
+        drop_piece = tetris.drop_piece
+        stamp_piece = tetris.stamp_piece
+        erase_piece = tetris.erase_piece
+        clear_full_rows = tetris.clear_full_rows
+        column_tops = tetris.column_tops
+
+        current_type = self.game.current_piece.type
         next_piece = self.game.next_piece
-
-        best_overall_score = float('-inf')
-        best_overall_move = None
-
-        num_rotations = len(current_piece.shapes)
-
-        # Try all placements of current piece
-        for rotation in range(num_rotations):
-            test_piece = Tetromino(current_piece.type)
-            test_piece.rotation = rotation
-            test_piece.shape = test_piece.shapes[rotation]
-            test_piece.y = 0
-
-            for x in range(-2, self.game.width + 2):
-                test_piece.x = x
-
-                if not self.game.valid_position(test_piece):
+        next_type = next_piece.type
+        full_row = self.game.full_row
+        # Shapes are trimmed to their bounding box: x runs from 0 up to width - piece width
+        current_widths = tetris.SHAPE_WIDTH[current_type]
+        next_widths = tetris.SHAPE_WIDTH[next_type]
+
+        # Pieces are stamped onto one working board and erased again after scoring
+        work_board = self.game.rows[:]
+        work_tops = self.game.col_heights
+
+        # Score every placement of the current piece on its own first
+        candidates: List[Tuple[float, int, int, int, int]] = []  # (score, order, rotation, x, landed y)
+        for rotation in range(len(self.game.current_piece.shapes)):
+            for x in range(self.game.width - current_widths[rotation] + 1):
+                landed_y = drop_piece(work_board, full_row, current_type, rotation, x, col_tops=work_tops)
+                if landed_y is None:
                     continue
 
-                # Drop piece
-                test_piece.y = 0
-                while self.game.valid_position(test_piece, offset_y=1):
-                    test_piece.y += 1
+                current_score = self.evaluate_board(clear_full_rows(work_board, full_row)[0], current_type)
+                erase_piece(work_board, full_row, current_type, rotation, x, landed_y)
+                candidates.append((current_score, len(candidates), rotation, x, landed_y))
 
-                if not self.game.valid_position(test_piece):
-                    continue
+        # Expand the most promising placements first so the pruning bound bites early
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
 
-                # Create test board after current piece
-                test_board1 = [row[:] for row in self.game.board]
-                for r, row in enumerate(test_piece.shape):
-                    for c, val in enumerate(row):
-                        if val:
-                            y = test_piece.y + r
-                            x_pos = test_piece.x + c
-                            if 0 <= y < len(test_board1) and 0 <= x_pos < len(test_board1[0]):
-                                test_board1[y][x_pos] = test_piece.color
-
-                test_board1 = self._clear_lines_from_board(test_board1)
-
-                # Evaluate current piece placement
-                current_score = self.evaluate_board(test_board1, current_piece.type)
-
-                # Now try all placements of next piece on this board
-                best_next_score = float('-inf')
-                num_rotations2 = len(next_piece.shapes)
-
-                for rotation2 in range(num_rotations2):
-                    test_piece2 = Tetromino(next_piece.type)
-                    test_piece2.rotation = rotation2
-                    test_piece2.shape = test_piece2.shapes[rotation2]
-                    test_piece2.y = 0
-
-                    for x2 in range(-2, len(test_board1[0]) + 2):
-                        test_piece2.x = x2
-
-                        if not self._is_valid_on_board(test_piece2, test_board1):
-                            continue
-
-                        test_piece2.y = 0
-                        while self._is_valid_on_board(test_piece2, test_board1, offset_y=1):
-                            test_piece2.y += 1
-
-                        if not self._is_valid_on_board(test_piece2, test_board1):
-                            continue
-
-                        # Create test board after next piece
-                        test_board2 = [row[:] for row in test_board1]
-                        for r, row in enumerate(test_piece2.shape):
-                            for c, val in enumerate(row):
-                                if val:
-                                    y = test_piece2.y + r
-                                    x_pos = test_piece2.x + c
-                                    if 0 <= y < len(test_board2) and 0 <= x_pos < len(test_board2[0]):
-                                        test_board2[y][x_pos] = test_piece2.color
-
-                        test_board2 = self._clear_lines_from_board(test_board2)
-                        next_score = self.evaluate_board(test_board2, next_piece.type)
-
-                        best_next_score = max(best_next_score, next_score)
-
-                # Combine current and next scores
-                if best_next_score == float('-inf'):
-                    combined_score = current_score
-                else:
-                    combined_score = 0.6 * current_score + 0.4 * best_next_score
+        best_overall_score = float('-inf')
+        best_overall_order = len(candidates)
+        best_overall_move = None
 
-                if combined_score > best_overall_score:
-                    best_overall_score = combined_score
-                    best_overall_move = (rotation, x)
+        for current_score, order, rotation, x, landed_y in candidates:
+            # The next piece can add at most MAX_NEXT_PIECE_BONUS; candidates are
+            # sorted by current score, so once one can't win none of the rest can
+            if 0.6 * current_score + MAX_NEXT_PIECE_BONUS < best_overall_score:
+                break
+
+            # Board after clearing lines (work_board itself if none cleared)
+            stamp_piece(work_board, full_row, current_type, rotation, x, landed_y)
+            test_board1 = clear_full_rows(work_board, full_row)[0]
+            tops1 = column_tops(test_board1, full_row)
+
+            # Now try all placements of next piece on this board
+            best_next_score = float('-inf')
+
+            for rotation2 in range(len(next_piece.shapes)):
+                for x2 in range(self.game.width - next_widths[rotation2] + 1):
+                    landed_y2 = drop_piece(test_board1, full_row, next_type, rotation2, x2, col_tops=tops1)
+                    if landed_y2 is None:
+                        continue
+
+                    test_board2 = clear_full_rows(test_board1, full_row)[0]
+                    next_score = self.evaluate_board(test_board2, next_type)
+                    best_next_score = max(best_next_score, next_score)
+                    erase_piece(test_board1, full_row, next_type, rotation2, x2, landed_y2)
+
+            erase_piece(work_board, full_row, current_type, rotation, x, landed_y)
+
+            # Combine current and next scores
+            if best_next_score == float('-inf'):
+                combined_score = current_score
+            else:
+                combined_score = 0.6 * current_score + 0.4 * best_next_score
+
+            # Ties go to the placement found first in rotation/x order
+            if (combined_score > best_overall_score or
+                    (combined_score == best_overall_score and order < best_overall_order)):
+                best_overall_score = combined_score
+                best_overall_order = order
+                best_overall_move = (rotation, x)
 
         return best_overall_move
 
     def _get_best_move_simple(self, piece: 'Tetromino') -> Optional[Tuple[int, int]]:
         """Get best move for a single piece without lookahead"""
-        from tetris import Tetromino
-
+        tetris = self._tetris
+        drop_piece = tetris.drop_piece
+        erase_piece = tetris.erase_piece
+        clear_full_rows = tetris.clear_full_rows
+
+        full_row = self.game.full_row
+        widths = tetris.SHAPE_WIDTH[piece.type]
+        work_board = self.game.rows[:]
         best_score: float = float('-inf')
         best_move: Optional[Tuple[int, int]] = None
 
-        num_rotations = len(piece.shapes)
-
-        for rotation in range(num_rotations):
-            test_piece = Tetromino(piece.type)
-            test_piece.rotation = rotation
-            test_piece.shape = test_piece.shapes[rotation]
-            test_piece.y = 0
-
-            for x in range(-2, self.game.width + 2):
-                test_piece.x = x
-
-                if not self.game.valid_position(test_piece):
+        for rotation in range(len(piece.shapes)):
+            for x in range(self.game.width - widths[rotation] + 1):
+                landed_y = drop_piece(work_board, full_row, piece.type, rotation, x,
+                                      col_tops=self.game.col_heights)
+                if landed_y is None:
                     continue
 
-                # Drop piece
-                test_piece.y = 0
-                while self.game.valid_position(test_piece, offset_y=1):
-                    test_piece.y += 1
-
-                if not self.game.valid_position(test_piece):
-                    continue
-
-                # Create test board
-                test_board = [row[:] for row in self.game.board]
-                for r, row in enumerate(test_piece.shape):
-                    for c, val in enumerate(row):
-                        if val:
-                            y = test_piece.y + r
-                            x_pos = test_piece.x + c
-                            if 0 <= y < len(test_board) and 0 <= x_pos < len(test_board[0]):
-                                test_board[y][x_pos] = test_piece.color
-
-                test_board = self._clear_lines_from_board(test_board)
+                # Board after clearing lines, then put the working board back
+                test_board = clear_full_rows(work_board, full_row)[0]
                 score = self.evaluate_board(test_board, piece.type)
+                erase_piece(work_board, full_row, piece.type, rotation, x, landed_y)
 
                 if score > best_score:
                     best_score = score
@@ -454,31 +474,6 @@ class TetrisAI:
 
         return best_move
 
-    def _clear_lines_from_board(self, board: List[List[str]]) -> List[List[str]]:
-        """Remove complete lines from a board and return new board"""
-        new_board = [row[:] for row in board if not all(cell != ' ' for cell in row)]
-        # Add empty lines at top for each cleared line
-        lines_cleared = len(board) - len(new_board)
-        for _ in range(lines_cleared):
-            new_board.insert(0, [' ' for _ in range(len(board[0]))])
-        return new_board
-
-    def _is_valid_on_board(self, piece: 'Tetromino', board: List[List[str]],
-                           offset_x: int = 0, offset_y: int = 0) -> bool:
-        """Check if piece position is valid on a given board"""
-        for r, row in enumerate(piece.shape):
-            for c, val in enumerate(row):
-                if val:
-                    new_y = piece.y + r + offset_y
-                    new_x = piece.x + c + offset_x
-
-                    if new_x < 0 or new_x >= len(board[0]) or new_y >= len(board):
-                        return False
-
-                    if new_y >= 0 and board[new_y][new_x] != ' ':
-                        return False
-        return True
-
     def execute_move(self, move: Optional[Tuple[int, int]]) -> None:
         """Execute the AI's chosen move - position piece and drop it fast"""
         if move is None:
@@ -487,8 +482,11 @@ class TetrisAI:
         rotation, target_x = move
         current_piece = self.game.current_piece
 
-        # Rotate to target rotation
-        while current_piece.rotation != rotation:
+        # Rotate to target rotation; a blocked rotation would never get there,
+        # so stop after one full turn and play the move from wherever it got to
+        for _ in range(len(current_piece.shapes)):
+            if current_piece.rotation == rotation:
+                break
             self.game.rotate()
 
         # Move to target x position
@@ -501,4 +499,4 @@ class TetrisAI:
         # Use soft drop speed for fast but visible descent
         # Set fall speed to nearly instant for this piece
         self.game.fall_speed = 0.005  # Super fast drop after positioning
-        self.game.last_fall_time = 0  # Make it drop immediately
+        self.game.last_fall_time_ns = 0  # Make it drop immediately